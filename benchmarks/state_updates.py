@@ -0,0 +1,196 @@
+"""Microbenchmark: whole-state vs delta state updates under a real checkpointer.
+
+Compiles the graph from ``graph_app`` with an ``InMemorySaver`` and runs it with
+deterministic stand-in agents (no model calls), then reports what the saver
+actually stored: channel blobs, checkpoints and pending task writes.
+
+* ``delta``: the graph as shipped; nodes return only changed keys and the
+  reducers in ``state`` merge them.
+* ``whole``: the same nodes wrapped to merge their delta themselves and return
+  the entire state over the pre-reducer schema: no ``matches`` channel, each
+  round's results embedded in the ``TournamentSummary`` instead.
+
+    python -m benchmarks.state_updates --population 32 --rounds 6
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, TypedDict
+
+os.environ.setdefault("OPENAI_API_KEY", "unused-benchmark-key")  # no calls are made
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+from coscientist import graph_app, tournament
+from coscientist.agents import RankingAgent
+from coscientist.state import (
+    Hypothesis,
+    MatchResult,
+    ResearchGoal,
+    Review,
+    TournamentSummary,
+    merge_population,
+    merge_reviews,
+)
+
+TEXT = "Repurpose compound X to inhibit pathway Y in AML cell lines at 1-10 uM. " * 4
+_rng = random.Random(0)
+
+
+class _Generation:
+    def __init__(self, n: int = 4):
+        self.n = n
+
+    def run(self, goal: ResearchGoal, generation: int) -> List[Hypothesis]:
+        return [Hypothesis(text=TEXT, rationale=TEXT, generation=generation)
+                for _ in range(self.n)]
+
+
+class _Reflection:
+    def __init__(self, use_web: bool = True):
+        pass
+
+    def run(self, goal: ResearchGoal, hyp: Hypothesis) -> Review:
+        items = [TEXT[:120]] * 3
+        return Review(hypothesis_id=hyp.id, strengths=items, weaknesses=items,
+                      risks=items, proposed_tests=items)
+
+
+class _Ranking(RankingAgent):
+    def compare(self, a: Hypothesis, b: Hypothesis, goal: ResearchGoal) -> Dict:
+        return {"winner": _rng.choice("AB"), "reasoning": TEXT, "judge": "single"}
+
+
+class _Evolution:
+    def run(self, base: Hypothesis, summary_patterns: List[str]) -> List[Hypothesis]:
+        return [Hypothesis(text=TEXT, rationale=base.rationale, parent_id=base.id,
+                           generation=base.generation + 1) for _ in range(2)]
+
+
+class _Proximity:
+    def score(self, goal: ResearchGoal, hyp: Hypothesis) -> float:
+        return _rng.randint(0, 100)
+
+
+class _MetaReview:
+    def run(self, goal: ResearchGoal, shortlist: List[Hypothesis]) -> str:
+        return TEXT * 10
+
+
+class _BaselineSummary(TournamentSummary):
+    results: List[MatchResult]
+
+
+class _WholeState(TypedDict):
+    goal: ResearchGoal
+    round_index: int
+    population: List[Hypothesis]
+    reviews: Dict[str, Review]
+    tournament: Optional[TournamentSummary]
+    overview: Optional[str]
+    params: Dict[str, int | float | str]
+
+
+NODES = ["generate", "reflect", "rank", "evolve", "proximity", "meta_review"]
+
+
+def _whole(node):
+    def run(state: Dict[str, Any]) -> Dict[str, Any]:
+        full = dict(state)
+        delta = node(state)
+        for key, value in delta.items():
+            if key == "population":
+                full[key] = merge_population(full[key], value)
+            elif key == "reviews":
+                full[key] = merge_reviews(full[key], value)
+            elif key != "matches":
+                full[key] = value
+        if "matches" in delta:
+            full["tournament"] = _BaselineSummary(
+                **delta["tournament"].model_dump(), results=delta["matches"]
+            )
+        return full
+
+    return run
+
+
+def _install_stubs() -> None:
+    graph_app.GenerationAgent = _Generation
+    graph_app.ReflectionAgent = _Reflection
+    graph_app.EvolutionAgent = _Evolution
+    graph_app.ProximityAgent = _Proximity
+    graph_app.MetaReviewAgent = _MetaReview
+    tournament.RankingAgent = _Ranking
+
+
+def _compile(mode: str, saver: InMemorySaver):
+    if mode == "delta":
+        return graph_app.build_app().compile(checkpointer=saver)
+    saved = {n: getattr(graph_app, f"node_{n}") for n in NODES}
+    schema = graph_app.CoScientistState
+    try:
+        graph_app.CoScientistState = _WholeState
+        for n, fn in saved.items():
+            setattr(graph_app, f"node_{n}", _whole(fn))
+        return graph_app.build_app().compile(checkpointer=saver)
+    finally:
+        graph_app.CoScientistState = schema
+        for n, fn in saved.items():
+            setattr(graph_app, f"node_{n}", fn)
+
+
+def _stored(saver: InMemorySaver) -> Dict[str, int]:
+    blobs = sum(len(b) for _, b in saver.blobs.values())
+    checkpoints = sum(
+        len(c[1]) + len(m[1])
+        for ns in saver.storage.values()
+        for cps in ns.values()
+        for c, m, _ in cps.values()
+    )
+    writes = sum(
+        len(w[2][1]) for per_ckpt in saver.writes.values() for w in per_ckpt.values()
+    )
+    return {"blobs": blobs, "checkpoints": checkpoints, "writes": writes}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--population", type=int, default=32)
+    parser.add_argument("--keep-top", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    _install_stubs()
+    params = {"rounds": args.rounds, "population": args.population,
+              "keep_top": args.keep_top, "shortlist": 5, "seed": args.seed}
+
+    print(f"{'mode':<8}{'blobs KB':>10}{'ckpt KB':>10}{'writes KB':>10}"
+          f"{'total KB':>10}{'wall ms':>10}")
+    totals = {}
+    for mode in ("whole", "delta"):
+        _rng.seed(args.seed)
+        saver = InMemorySaver()
+        app = _compile(mode, saver)
+        config = {"configurable": {"thread_id": mode}, "recursion_limit": 1000}
+        initial = graph_app.initial_state(TEXT, params)
+        if mode == "whole":
+            del initial["matches"]
+        t0 = time.perf_counter()
+        app.invoke(initial, config)
+        wall = time.perf_counter() - t0
+        sizes = _stored(saver)
+        totals[mode] = sum(sizes.values())
+        print(f"{mode:<8}{sizes['blobs'] / 1024:>10.1f}"
+              f"{sizes['checkpoints'] / 1024:>10.1f}{sizes['writes'] / 1024:>10.1f}"
+              f"{totals[mode] / 1024:>10.1f}{wall * 1e3:>10.1f}")
+    print(f"\nstored bytes, whole/delta: {totals['whole'] / totals['delta']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
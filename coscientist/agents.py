@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, Dict
+import re
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -29,6 +31,9 @@ logger = logging.getLogger(__name__)
 LLM_MODEL = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
 CRITIC_MODEL = ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
 DEBATE_MODEL = ChatOpenAI(model="gpt-4o-mini", temperature=0.5)
+# Judge cascade: cheap deterministic first pass, stronger model on escalation
+JUDGE_MODEL = ChatOpenAI(model="gpt-4o-mini", temperature=0.0)
+ESCALATION_MODEL = ChatOpenAI(model="gpt-4o", temperature=0.2)
 
 
 class GenerationAgent:
@@ -147,34 +152,169 @@ class ReflectionAgent:
         return rev
 
 
+@dataclass
+class JudgeStats:
+    matches: int = 0
+    settled_fast: int = 0
+    escalated: int = 0
+    fast_agreed: int = 0  # both orderings parsed and picked the same hypothesis
+    fast_disagreed: int = 0  # position flip: verdict depends on A/B order
+    fast_unparsed: int = 0  # at least one fast verdict had no WINNER line
+    fast_no_confidence: int = 0  # agreed, but an ordering had no CONFIDENCE line
+    low_confidence: int = 0
+    strong_overruled: int = 0  # strong judge picked the other hypothesis
+    undecided: int = 0  # no usable verdict from any tier; scored as a draw
+
+    def as_dict(self) -> Dict[str, float]:
+        out: Dict[str, float] = dict(self.__dict__)
+        parsed = self.fast_agreed + self.fast_disagreed
+        out["escalation_rate"] = self.escalated / self.matches if self.matches else 0.0
+        out["fast_agreement_rate"] = self.fast_agreed / parsed if parsed else 0.0
+        return out
+
+
 class RankingAgent:
-    def __init__(self):
+    def __init__(self, cascade: bool = False, min_confidence: int = 70):
+        self.cascade = cascade
+        self.min_confidence = min_confidence
+        self.stats = JudgeStats()
         self.logger = logging.getLogger(f"{__name__}.RankingAgent")
-        self.logger.info("Initialized RankingAgent")
+        self.logger.info(
+            f"Initialized RankingAgent with cascade={cascade}, min_confidence={min_confidence}"
+        )
 
-    def compare(self, a: Hypothesis, b: Hypothesis, goal: ResearchGoal) -> Dict:
-        self.logger.info(f"Comparing hypotheses: {a.text[:50]}... vs {b.text[:50]}...")
+    def _inputs(self, goal: ResearchGoal, a: Hypothesis, b: Hypothesis) -> Dict:
+        return {
+            "goal": goal.text,
+            "a": f"{a.text}\nRATIONALE: {a.rationale}",
+            "b": f"{b.text}\nRATIONALE: {b.rationale}",
+        }
+
+    def _chain(self, model: ChatOpenAI):
         prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", PAIRWISE_DEBATE_PROMPT),
                 ("human", "Goal: {goal}\nA: {a}\nB: {b}"),
             ]
         )
-        out = (
-            (prompt | DEBATE_MODEL)
-            .invoke(
-                {
-                    "goal": goal.text,
-                    "a": f"{a.text}\nRATIONALE: {a.rationale}",
-                    "b": f"{b.text}\nRATIONALE: {b.rationale}",
+        return prompt | model
+
+    @staticmethod
+    def _parse(out: str) -> Tuple[Optional[str], Optional[int], str]:
+        m = re.search(r"WINNER\W*([AB])\b", out, re.I)
+        winner = m.group(1).upper() if m else None
+        m = re.search(r"CONFIDENCE\W*(\d{1,3})", out, re.I)
+        confidence = max(0, min(100, int(m.group(1)))) if m else None
+        reasoning = out.split("REASONING:")[-1].strip()
+        return winner, confidence, reasoning
+
+    def compare(self, a: Hypothesis, b: Hypothesis, goal: ResearchGoal) -> Dict:
+        self.logger.info(f"Comparing hypotheses: {a.text[:50]}... vs {b.text[:50]}...")
+        if self.cascade:
+            return self._compare_cascade(a, b, goal)
+        out = self._chain(DEBATE_MODEL).invoke(self._inputs(goal, a, b)).content
+        winner, confidence, reasoning = self._parse(out)
+        if winner is None:
+            self.logger.warning("No WINNER line in debate output; defaulting to A")
+            winner = "A"
+        self.logger.info(f"Comparison complete. Winner: {winner}")
+        return {
+            "winner": winner,
+            "reasoning": reasoning,
+            "confidence": confidence,
+            "judge": "single",
+        }
+
+    def _compare_cascade(self, a: Hypothesis, b: Hypothesis, goal: ResearchGoal) -> Dict:
+        self.stats.matches += 1
+        # Fast tier: judge both orderings concurrently to expose position bias
+        fwd, rev = self._chain(JUDGE_MODEL).batch(
+            [self._inputs(goal, a, b), self._inputs(goal, b, a)]
+        )
+        w1, c1, r1 = self._parse(fwd.content)
+        w2, c2, r2 = self._parse(rev.content)
+        w2 = {"A": "B", "B": "A"}.get(w2) if w2 else None  # map back to a/b
+        fast_conf = min(c1, c2) if c1 is not None and c2 is not None else None
+
+        reason = None
+        if w1 is None or w2 is None:
+            self.stats.fast_unparsed += 1
+            reason = "unparsed"
+        elif w1 != w2:
+            self.stats.fast_disagreed += 1
+            reason = "disagreement"
+        else:
+            self.stats.fast_agreed += 1
+            # A missing CONFIDENCE line is no evidence of a confident verdict
+            if fast_conf is None:
+                self.stats.fast_no_confidence += 1
+                reason = "no_confidence"
+            elif fast_conf < self.min_confidence:
+                self.stats.low_confidence += 1
+                reason = "low_confidence"
+
+        if reason is None:
+            self.stats.settled_fast += 1
+            self.logger.info(f"Comparison settled by fast judge. Winner: {w1}")
+            return {
+                "winner": w1,
+                "reasoning": r1,
+                "confidence": fast_conf,
+                "judge": "fast",
+            }
+
+        self.stats.escalated += 1
+        self.logger.info(f"Escalating comparison to strong judge ({reason})")
+        out = self._chain(ESCALATION_MODEL).invoke(self._inputs(goal, a, b)).content
+        winner, confidence, reasoning = self._parse(out)
+        if winner is None:
+            # Fall back only to a fast verdict that no ordering contradicts
+            winner = (w1 or w2) if w1 == w2 or None in (w1, w2) else None
+            reasoning = (
+                r1
+                if w1
+                else f"[judged with A/B swapped: A = {b.id[:8]}, B = {a.id[:8]}] {r2}"
+            )
+            if winner is None:
+                self.stats.undecided += 1
+                self.logger.warning(
+                    "No WINNER line from strong judge and no consistent fast verdict; "
+                    "scoring as a draw"
+                )
+                return {
+                    "winner": None,
+                    "reasoning": reasoning,
+                    "confidence": None,
+                    "judge": "undecided",
                 }
+            self.logger.warning(
+                f"No WINNER line from strong judge; falling back to {winner}"
             )
-            .content
-        )
-        winner = "A" if "WINNER: A" in out else ("B" if "WINNER: B" in out else "A")
-        reasoning = out.split("REASONING:")[-1].strip()
+        elif w1 is not None and winner != w1:
+            self.stats.strong_overruled += 1
         self.logger.info(f"Comparison complete. Winner: {winner}")
-        return {"winner": winner, "reasoning": reasoning}
+        return {
+            "winner": winner,
+            "reasoning": reasoning,
+            "confidence": confidence,
+            "judge": "strong",
+        }
+
+    def log_stats(self) -> None:
+        if not self.cascade or not self.stats.matches:
+            return
+        s = self.stats.as_dict()
+        self.logger.info(
+            f"Judge cascade: {self.stats.matches} matches, "
+            f"{self.stats.settled_fast} settled fast, {self.stats.escalated} escalated "
+            f"(rate={s['escalation_rate']:.0%}; unparsed={self.stats.fast_unparsed}, "
+            f"disagreement={self.stats.fast_disagreed}, "
+            f"no_confidence={self.stats.fast_no_confidence}, "
+            f"low_confidence={self.stats.low_confidence}), "
+            f"fast A/B agreement={s['fast_agreement_rate']:.0%}, "
+            f"undecided={self.stats.undecided}, "
+            f"strong overruled={self.stats.strong_overruled}"
+        )
 
 
 class EvolutionAgent:
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import List
+from typing import Any, Dict, List
 
 from langgraph.graph import END, StateGraph
 
 from .agents import (EvolutionAgent, GenerationAgent, MetaReviewAgent,
                      ProximityAgent, ReflectionAgent)
-from .state import CoScientistState, Hypothesis, ResearchGoal
+from .state import CoScientistState, Hypothesis, RemoveHypothesis, ResearchGoal
 from .tournament import run_tournament
 
 # Configure logging
@@ -17,7 +17,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def node_generate(state: CoScientistState) -> CoScientistState:
+def node_generate(state: CoScientistState) -> Dict[str, Any]:
     logger.info("Starting generation phase")
     params = state["params"]
     population_size = int(params.get("population", 6))
@@ -25,13 +25,12 @@ def node_generate(state: CoScientistState) -> CoScientistState:
 
     gen = GenerationAgent(n=population_size)
     hyps = gen.run(state["goal"], generation=state["round_index"])
-    state["population"] = hyps
 
     logger.info(f"Generated {len(hyps)} hypotheses in round {state['round_index']}")
-    return state
+    return {"population": hyps}
 
 
-def node_reflect(state: CoScientistState) -> CoScientistState:
+def node_reflect(state: CoScientistState) -> Dict[str, Any]:
     logger.info("Starting reflection phase")
     refl = ReflectionAgent(use_web=True)
     reviews = {}
@@ -40,33 +39,44 @@ def node_reflect(state: CoScientistState) -> CoScientistState:
     for h in state["population"]:
         logger.debug(f"Reviewing hypothesis {h.id}")
         reviews[h.id] = refl.run(state["goal"], h)
-    state["reviews"] = reviews
 
     logger.info(f"Completed {len(reviews)} reviews")
-    return state
+    return {"reviews": reviews}
 
 
-def node_rank(state: CoScientistState) -> CoScientistState:
+def node_rank(state: CoScientistState) -> Dict[str, Any]:
     logger.info("Starting ranking phase")
     seed = int(state["params"].get("seed", 0))
-    logger.info(f"Running tournament with seed {seed}")
-
-    ts = run_tournament(
-        state["population"], state["goal"], rnd=state["round_index"], seed=seed
+    cascade = state["params"].get("judge", "single") == "cascade"
+    min_confidence = int(state["params"].get("judge_confidence", 70))
+    logger.info(f"Running tournament with seed {seed}, cascade={cascade}")
+
+    ts, results = run_tournament(
+        state["population"],
+        state["goal"],
+        rnd=state["round_index"],
+        seed=seed,
+        cascade=cascade,
+        min_confidence=min_confidence,
     )
-    state["tournament"] = ts
+    # project ELO back to hypotheses for downstream selection
+    rescored = [
+        h.model_copy(update={"score": ts.ratings[h.id]})
+        for h in state["population"]
+        if ts.ratings.get(h.id, h.score) != h.score
+    ]
 
     logger.info("Tournament completed")
-    return state
+    return {"tournament": ts, "matches": results, "population": rescored}
 
 
-def node_evolve(state: CoScientistState) -> CoScientistState:
+def node_evolve(state: CoScientistState) -> Dict[str, Any]:
     logger.info("Starting evolution phase")
     keep_top = int(state["params"].get("keep_top", 4))
     logger.info(f"Keeping top {keep_top} hypotheses")
 
     pop = sorted(state["population"], key=lambda h: h.score, reverse=True)
-    winners = pop[:keep_top]
+    winners, losers = pop[:keep_top], pop[keep_top:]
     logger.info(f"Selected {len(winners)} winners for evolution")
 
     evo = EvolutionAgent()
@@ -76,26 +86,33 @@ def node_evolve(state: CoScientistState) -> CoScientistState:
         logger.debug(f"Generated {len(new_variants)} variants from hypothesis {w.id}")
         new_gen.extend(new_variants)
 
-    state["population"] = winners + new_gen
-    state["round_index"] += 1
-    logger.info(f"Evolution complete. New population size: {len(state['population'])}")
-    return state
+    logger.info(
+        f"Evolution complete. New population size: {len(winners) + len(new_gen)}"
+    )
+    # Drop everyone and re-add the winners so the merged population is
+    # winners in score order + new_gen, which fixes the tournament pairing order
+    return {
+        "population": [RemoveHypothesis(id=h.id) for h in pop] + winners + new_gen,
+        "reviews": {h.id: None for h in losers},
+        "round_index": state["round_index"] + 1,
+    }
 
 
-def node_proximity(state: CoScientistState) -> CoScientistState:
+def node_proximity(state: CoScientistState) -> Dict[str, Any]:
     logger.info("Starting proximity analysis")
     prox = ProximityAgent()
 
+    rescored: List[Hypothesis] = []
     for h in state["population"]:
-        old_score = h.score
-        h.score = 0.5 * h.score + 5 * prox.score(state["goal"], h)
-        logger.debug(f"Hypothesis {h.id}: score adjusted from {old_score} to {h.score}")
+        new_score = 0.5 * h.score + 5 * prox.score(state["goal"], h)
+        logger.debug(f"Hypothesis {h.id}: score adjusted from {h.score} to {new_score}")
+        rescored.append(h.model_copy(update={"score": new_score}))
 
     logger.info("Proximity analysis complete")
-    return state
+    return {"population": rescored}
 
 
-def node_meta_review(state: CoScientistState) -> CoScientistState:
+def node_meta_review(state: CoScientistState) -> Dict[str, Any]:
     logger.info("Starting meta review")
     shortlist_size = int(state["params"].get("shortlist", 5))
     shortlist = sorted(state["population"], key=lambda h: h.score, reverse=True)[
@@ -104,10 +121,23 @@ def node_meta_review(state: CoScientistState) -> CoScientistState:
 
     logger.info(f"Reviewing top {len(shortlist)} hypotheses")
     meta = MetaReviewAgent()
-    state["overview"] = meta.run(state["goal"], shortlist)
+    overview = meta.run(state["goal"], shortlist)
 
     logger.info("Meta review complete")
-    return state
+    return {"overview": overview}
+
+
+def initial_state(goal: str, params: Dict[str, int | float | str]) -> CoScientistState:
+    return {
+        "goal": ResearchGoal(text=goal),
+        "round_index": 0,
+        "population": [],
+        "reviews": {},
+        "tournament": None,
+        "matches": [],
+        "overview": None,
+        "params": dict(params),
+    }
 
 
 def build_app(rounds: int = 2) -> StateGraph:
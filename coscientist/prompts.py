@@ -19,6 +19,7 @@ Two hypotheses (A vs B) address the same goal. Pick the **better** one for near
 Criteria: novelty, plausibility, clarity, testability, alignment to constraints.
 Respond with:
 WINNER: A or B
+CONFIDENCE: 0–100, how sure you are of the verdict
 REASONING: short bullet explanation including any decisive weakness in the loser.
 """
 
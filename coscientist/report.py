@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from .state import CoScientistState, Hypothesis
+
+
+def shortlist(final: CoScientistState, n: int) -> List[Hypothesis]:
+    return sorted(final["population"], key=lambda x: x.score, reverse=True)[:n]
+
+
+def render_markdown(
+    goal: str, final: CoScientistState, n: int, now: Optional[datetime] = None
+) -> str:
+    now = now or datetime.now()
+    output_content = []
+    output_content.append(f"# Research Results - {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    output_content.append(f"**Research Goal:** {goal}\n")
+
+    output_content.append("## Research Overview\n")
+    output_content.append(final["overview"])
+
+    output_content.append("\n## Shortlisted Hypotheses\n")
+    for h in shortlist(final, n):
+        output_content.append(
+            f"- **{h.text}** (score={h.score:.1f}, gen={h.generation}, id={h.id[:8]})"
+        )
+    return "\n".join(output_content)
+
+
+def output_filename(now: Optional[datetime] = None) -> Tuple[str, datetime]:
+    # Generate unique filename with UUID and datetime
+    now = now or datetime.now()
+    date_time_str = now.strftime("%Y%m%d_%H%M%S")
+    unique_id = str(uuid.uuid4())
+    return f"research_output_{date_time_str}_{unique_id}.md", now
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socketserver
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+
+from .graph_app import build_app, initial_state
+from .report import output_filename, render_markdown, shortlist
+from .state import CoScientistState
+
+logger = logging.getLogger(__name__)
+
+# Same defaults as run.py
+DEFAULT_PARAMS: Dict[str, int | str] = {
+    "rounds": 1,
+    "population": 2,
+    "keep_top": 2,
+    "shortlist": 2,
+    "seed": 0,
+    "judge": "single",
+    "judge_confidence": 70,
+}
+
+TERMINAL = ("completed", "failed", "cancelled")
+
+
+@dataclass
+class Run:
+    goal: str
+    params: Dict[str, int | str]
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = "queued"  # queued | running | completed | failed | cancelled
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    report_path: Optional[str] = None
+    final: Optional[CoScientistState] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    cancel_requested: threading.Event = field(default_factory=threading.Event)
+    cond: threading.Condition = field(default_factory=threading.Condition)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL
+
+    def emit(self, kind: str, **payload: Any) -> None:
+        with self.cond:
+            self.events.append(
+                {"seq": len(self.events), "ts": time.time(), "event": kind, **payload}
+            )
+            self.cond.notify_all()
+
+    def set_status(self, status: str, **payload: Any) -> None:
+        # Under the lock so followers never see a terminal status without its event
+        with self.cond:
+            self.status = status
+            if status == "running":
+                self.started_at = time.time()
+            elif status in TERMINAL:
+                self.finished_at = time.time()
+            self.emit("status", status=status, **payload)
+
+    def follow(self, start: int = 0, heartbeat: float = 15.0) -> Iterator[Dict[str, Any]]:
+        """Yield events from ``start`` on, blocking until the run finishes."""
+        seq = start
+        while True:
+            with self.cond:
+                while seq >= len(self.events) and not self.done:
+                    if not self.cond.wait(timeout=heartbeat):
+                        break
+                pending = self.events[seq:]
+                finished = self.done
+            if not pending and not finished:
+                yield {"event": "heartbeat", "ts": time.time()}
+            for ev in pending:
+                yield ev
+            seq += len(pending)
+            if finished and seq >= len(self.events):
+                return
+
+    def report(self) -> Optional[str]:
+        if self.final is None:
+            return None
+        return render_markdown(self.goal, self.final, int(self.params["shortlist"]))
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "id": self.id,
+            "goal": self.goal,
+            "params": self.params,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "report_path": self.report_path,
+            "events": len(self.events),
+        }
+        if include_result and self.final is not None:
+            out["overview"] = self.final["overview"]
+            out["shortlist"] = [
+                h.model_dump() for h in shortlist(self.final, int(self.params["shortlist"]))
+            ]
+        return out
+
+
+class RunManager:
+    """Runs goals concurrently against one compiled graph kept in memory."""
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        write_reports: bool = False,
+        report_dir: str = ".",
+        keep_finished: int = 100,
+        finished_ttl: float = 3600.0,
+    ):
+        self.logger = logging.getLogger(f"{__name__}.RunManager")
+        self.logger.info("Compiling application graph...")
+        self.app = build_app().compile()
+        self.write_reports = write_reports
+        self.report_dir = report_dir
+        # Retention: finished runs hold their whole final state and event log
+        self.keep_finished = keep_finished
+        self.finished_ttl = finished_ttl
+        self.runs: Dict[str, Run] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="coscientist-run"
+        )
+        self.logger.info(f"RunManager ready (max_concurrent={max_concurrent})")
+
+    def submit(self, goal: str, params: Optional[Dict[str, Any]] = None) -> Run:
+        merged = dict(DEFAULT_PARAMS)
+        for k, v in (params or {}).items():
+            if k in DEFAULT_PARAMS:
+                merged[k] = type(DEFAULT_PARAMS[k])(v)
+        if merged["judge"] not in ("single", "cascade"):
+            raise ValueError("judge must be 'single' or 'cascade'")
+        run = Run(goal=goal, params=merged)
+        self._prune()
+        with self._lock:
+            self.runs[run.id] = run
+        run.emit("status", status=run.status)
+        self._pool.submit(self._execute, run)
+        self.logger.info(f"Queued run {run.id} for goal: {goal[:100]}...")
+        return run
+
+    def get(self, run_id: str) -> Optional[Run]:
+        self._prune()
+        with self._lock:
+            return self.runs.get(run_id)
+
+    def list(self) -> List[Run]:
+        self._prune()
+        with self._lock:
+            return list(self.runs.values())
+
+    def _prune(self) -> None:
+        """Evict finished runs past ``finished_ttl`` or beyond ``keep_finished``."""
+        now = time.time()
+        with self._lock:
+            finished = sorted(
+                (r for r in self.runs.values() if r.done), key=lambda r: r.finished_at
+            )
+            overflow = len(finished) - self.keep_finished
+            evicted = [
+                r
+                for i, r in enumerate(finished)
+                if i < overflow or now - r.finished_at > self.finished_ttl
+            ]
+            for r in evicted:
+                del self.runs[r.id]
+        if evicted:
+            self.logger.info(f"Evicted {len(evicted)} finished run(s)")
+
+    def cancel(self, run_id: str) -> Optional[Run]:
+        run = self.get(run_id)
+        if run is None:
+            return None
+        if not run.done:
+            # Cooperative: takes effect at the next graph step boundary
+            run.cancel_requested.set()
+            run.emit("cancel_requested")
+            self.logger.info(f"Cancellation requested for run {run_id}")
+        return run
+
+    def shutdown(self) -> None:
+        for run in self.list():
+            run.cancel_requested.set()
+        self._pool.shutdown(wait=True)
+
+    def _execute(self, run: Run) -> None:
+        if run.cancel_requested.is_set():
+            run.set_status("cancelled")
+            return
+        run.set_status("running")
+        last: Optional[CoScientistState] = None
+        try:
+            stream = self.app.stream(
+                initial_state(run.goal, run.params), stream_mode=["updates", "values"]
+            )
+            for mode, chunk in stream:
+                if mode == "values":
+                    last = chunk
+                    # meta_review is the last node; a cancel arriving during it is moot
+                    if run.cancel_requested.is_set() and last.get("overview") is None:
+                        stream.close()
+                        run.set_status("cancelled")
+                        self.logger.info(f"Run {run.id} cancelled")
+                        return
+                else:
+                    for node, delta in chunk.items():
+                        run.emit(
+                            "step",
+                            node=node,
+                            updated=sorted(delta or {}),
+                            round_index=(delta or {}).get(
+                                "round_index", (last or {}).get("round_index", 0)
+                            ),
+                        )
+            run.final = last
+            if self.write_reports and last is not None:
+                filename, _ = output_filename()
+                run.report_path = os.path.join(self.report_dir, filename)
+                with open(run.report_path, "w") as f:
+                    f.write(run.report())
+                self.logger.info(f"Research output saved to {run.report_path}")
+            run.set_status("completed")
+            self.logger.info(f"Run {run.id} completed")
+        except Exception as e:
+            run.error = str(e)
+            run.set_status("failed", error=run.error)
+            self.logger.error(f"Run {run.id} failed: {e}", exc_info=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """JSON API:
+
+    POST   /runs              {"goal": str, "rounds": int, ...}  -> 202 run
+    GET    /runs                                                 -> [run]
+    GET    /runs/<id>                                            -> run + result
+    GET    /runs/<id>/events  NDJSON progress stream until the run ends
+    GET    /runs/<id>/report  markdown report once completed
+    DELETE /runs/<id>         request cancellation
+    GET    /health
+    """
+
+    manager: RunManager
+
+    def address_string(self) -> str:
+        # client_address is not a (host, port) tuple on Unix sockets
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status: int, body: Any) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self) -> List[str]:
+        return [p for p in self.path.split("?")[0].split("/") if p]
+
+    def _run_or_404(self, run_id: str) -> Optional[Run]:
+        run = self.manager.get(run_id)
+        if run is None:
+            self._send_json(404, {"error": f"unknown run {run_id}"})
+        return run
+
+    def do_GET(self) -> None:
+        parts = self._route()
+        if parts == ["health"]:
+            self._send_json(200, {"status": "ok", "runs": len(self.manager.list())})
+        elif parts == ["runs"]:
+            self._send_json(200, [r.to_dict() for r in self.manager.list()])
+        elif len(parts) == 2 and parts[0] == "runs":
+            run = self._run_or_404(parts[1])
+            if run:
+                self._send_json(200, run.to_dict(include_result=True))
+        elif len(parts) == 3 and parts[0] == "runs" and parts[2] == "events":
+            run = self._run_or_404(parts[1])
+            if run:
+                self._stream_events(run)
+        elif len(parts) == 3 and parts[0] == "runs" and parts[2] == "report":
+            run = self._run_or_404(parts[1])
+            if run:
+                report = run.report()
+                if report is None:
+                    self._send_json(409, {"error": f"run is {run.status}"})
+                    return
+                data = report.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/markdown; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if self._route() != ["runs"]:
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise ValueError("body must be a JSON object")
+            goal = body.pop("goal")
+            if not isinstance(goal, str) or not goal.strip():
+                raise ValueError("goal must be a non-empty string")
+            run = self.manager.submit(goal, body)
+        except (KeyError, ValueError, TypeError) as e:
+            self._send_json(400, {"error": f"invalid request: {e}"})
+            return
+        self._send_json(202, run.to_dict())
+
+    def do_DELETE(self) -> None:
+        parts = self._route()
+        if len(parts) != 2 or parts[0] != "runs":
+            self._send_json(404, {"error": "not found"})
+            return
+        run = self.manager.cancel(parts[1])
+        if run is None:
+            self._send_json(404, {"error": f"unknown run {parts[1]}"})
+            return
+        self._send_json(202, run.to_dict())
+
+    def _stream_events(self, run: Run) -> None:
+        # HTTP/1.0 response without Content-Length: the body ends when we close
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        try:
+            for ev in run.follow():
+                self.wfile.write((json.dumps(ev) + "\n").encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug(f"Event stream for run {run.id} closed by client")
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    manager: RunManager,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    handler = type("CoScientistHandler", (_Handler,), {"manager": manager})
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return ThreadingUnixHTTPServer(socket_path, handler)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
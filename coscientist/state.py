@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import operator
 import uuid
-from typing import Dict, List, Optional, TypedDict
+from typing import Annotated, Dict, List, Optional, TypedDict, Union
 
 from pydantic import BaseModel, Field
 
@@ -39,24 +40,67 @@ class Review(BaseModel):
 
 
 class MatchResult(BaseModel):
+    round_index: int
     a_id: str
     b_id: str
-    winner_id: str
-    loser_id: str
+    winner_id: Optional[str] = None  # None for a draw: no judge gave a usable verdict
+    loser_id: Optional[str] = None
     reasoning: str
+    judge: Optional[str] = None  # tier that settled the match ("fast", "strong", ...)
 
 
 class TournamentSummary(BaseModel):
-    round_index: int
-    results: List[MatchResult]
+    round_index: int  # the round's MatchResults live in CoScientistState["matches"]
     patterns: List[str]  # e.g., recurring strengths/weaknesses across winners
+    ratings: Dict[str, float] = Field(default_factory=dict)  # ELO after the round
+    judge_stats: Dict[str, float] = Field(default_factory=dict)
+
+
+class RemoveHypothesis(BaseModel):
+    """Population delta that drops the hypothesis with the given id."""
+
+    id: str
+
+
+PopulationUpdate = List[Union[Hypothesis, RemoveHypothesis]]
+
+
+def merge_population(
+    left: Optional[List[Hypothesis]], right: Optional[PopulationUpdate]
+) -> List[Hypothesis]:
+    """Reducer for ``population``: upsert hypotheses by id, honour removals.
+
+    Nodes return only the hypotheses they created or changed; existing entries
+    keep their position and are replaced in place, new ones are appended.
+    """
+    merged = {h.id: h for h in (left or [])}
+    for item in right or []:
+        if isinstance(item, RemoveHypothesis):
+            merged.pop(item.id, None)
+        else:
+            merged[item.id] = item
+    return list(merged.values())
+
+
+def merge_reviews(
+    left: Optional[Dict[str, Review]], right: Optional[Dict[str, Optional[Review]]]
+) -> Dict[str, Review]:
+    """Reducer for ``reviews``: merge by hypothesis id, a ``None`` value removes."""
+    merged = dict(left or {})
+    for hyp_id, rev in (right or {}).items():
+        if rev is None:
+            merged.pop(hyp_id, None)
+        else:
+            merged[hyp_id] = rev
+    return merged
 
 
 class CoScientistState(TypedDict):
     goal: ResearchGoal
     round_index: int
-    population: List[Hypothesis]
-    reviews: Dict[str, Review]
+    population: Annotated[List[Hypothesis], merge_population]
+    reviews: Annotated[Dict[str, Review], merge_reviews]
     tournament: Optional[TournamentSummary]
+    matches: Annotated[List[MatchResult], operator.add]  # all rounds, append-only
     overview: Optional[str]
     params: Dict[str, int | float | str]
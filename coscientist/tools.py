@@ -1,12 +1,18 @@
 from __future__ import annotations
 import json, logging, os
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
 from openai import OpenAI
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _shared_client(api_key: Optional[str], base_url: Optional[str]) -> OpenAI:
+    # One client (and HTTP connection pool) per endpoint, reused across agents
+    return OpenAI(api_key=api_key, base_url=base_url)
+
 @dataclass
 class OpenAIWebSearch:
     # Use a standard model with the Responses API
@@ -14,9 +20,9 @@ class OpenAIWebSearch:
     k: int = 5
 
     def __post_init__(self):
-        self.client = OpenAI(
-            api_key=os.getenv("OPENAI_API_KEY"),
-            base_url=os.getenv("OPENAI_API_BASE"),  # optional; remove if not using a proxy
+        self.client = _shared_client(
+            os.getenv("OPENAI_API_KEY"),
+            os.getenv("OPENAI_API_BASE"),  # optional; remove if not using a proxy
         )
 
     def _parse_json_array(self, text: str) -> List[Dict]:
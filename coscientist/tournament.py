@@ -27,10 +27,15 @@ class EloRanker:
 
 
 def run_tournament(
-    hypotheses: List[Hypothesis], goal: ResearchGoal, rnd: int, seed: int = 0
-) -> TournamentSummary:
+    hypotheses: List[Hypothesis],
+    goal: ResearchGoal,
+    rnd: int,
+    seed: int = 0,
+    cascade: bool = False,
+    min_confidence: int = 70,
+) -> Tuple[TournamentSummary, List[MatchResult]]:
     rng = random.Random(seed + rnd)
-    ranking = RankingAgent()
+    ranking = RankingAgent(cascade=cascade, min_confidence=min_confidence)
     elo = EloRanker()
     pairs: List[Tuple[Hypothesis, Hypothesis]] = []
     shuffled = hypotheses[:]
@@ -42,20 +47,40 @@ def run_tournament(
     patterns = []
     for a, b in pairs:
         out = ranking.compare(a, b, goal)
+        if out["winner"] is None:
+            # draw: no verdict to learn from, leave both ratings untouched
+            results.append(
+                MatchResult(
+                    round_index=rnd,
+                    a_id=a.id,
+                    b_id=b.id,
+                    reasoning=out["reasoning"],
+                    judge=out.get("judge"),
+                )
+            )
+            continue
         winner = a if out["winner"] == "A" else b
         loser = b if winner is a else a
         elo.update(winner.id, loser.id)
         results.append(
             MatchResult(
+                round_index=rnd,
                 a_id=a.id,
                 b_id=b.id,
                 winner_id=winner.id,
                 loser_id=loser.id,
                 reasoning=out["reasoning"],
+                judge=out.get("judge"),
             )
         )
         patterns.append(out["reasoning"])  # naive; could summarize later
-    # project ELO back to hypotheses for downstream selection
-    for h in hypotheses:
-        h.score = elo.rating(h.id)
-    return TournamentSummary(round_index=rnd, results=results, patterns=patterns)
+    ranking.log_stats()
+    # ELO per hypothesis; the caller projects it back onto the population
+    ratings = {h.id: elo.rating(h.id) for h in hypotheses}
+    summary = TournamentSummary(
+        round_index=rnd,
+        patterns=patterns,
+        ratings=ratings,
+        judge_stats=ranking.stats.as_dict() if cascade else {},
+    )
+    return summary, results
@@ -3,10 +3,8 @@ from __future__ import annotations
 import argparse
 import logging
 
-from coscientist.graph_app import build_app
-from coscientist.state import CoScientistState, ResearchGoal
-import uuid
-from datetime import datetime
+from coscientist.graph_app import build_app, initial_state
+from coscientist.report import output_filename, render_markdown, shortlist
 
 # Configure logging
 logging.basicConfig(
@@ -23,30 +21,40 @@ parser.add_argument("--population", type=int, default=2)
 parser.add_argument("--keep-top", type=int, default=2)
 parser.add_argument("--shortlist", type=int, default=2)
 parser.add_argument("--seed", type=int, default=0)
+parser.add_argument(
+    "--judge",
+    choices=["single", "cascade"],
+    default="single",
+    help="single: one debate model; cascade: fast A/B-swapped judge, escalate when unsure",
+)
+parser.add_argument(
+    "--judge-confidence",
+    type=int,
+    default=70,
+    help="Escalate cascade verdicts whose confidence is below this (0-100)",
+)
 args = parser.parse_args()
 
 logger.info(f"Starting CoScientist with arguments: {vars(args)}")
 
-initial: CoScientistState = {
-    "goal": ResearchGoal(text=args.goal),
-    "round_index": 0,
-    "population": [],
-    "reviews": {},
-    "tournament": None,
-    "overview": None,
-    "params": {
+initial = initial_state(
+    args.goal,
+    {
         "rounds": args.rounds,
         "population": args.population,
         "keep_top": args.keep_top,
         "shortlist": args.shortlist,
         "seed": args.seed,
+        "judge": args.judge,
+        "judge_confidence": args.judge_confidence,
     },
-}
+)
 
 logger.info(f"Initialized state with research goal: {args.goal}")
 logger.info(
     f"Parameters: rounds={args.rounds}, population={args.population}, "
-    f"keep_top={args.keep_top}, shortlist={args.shortlist}, seed={args.seed}"
+    f"keep_top={args.keep_top}, shortlist={args.shortlist}, seed={args.seed}, "
+    f"judge={args.judge}"
 )
 
 try:
@@ -59,30 +67,15 @@ try:
     logger.info("Application completed successfully")
 
     # Sort population once
-    sorted_population = sorted(final["population"], key=lambda x: x.score, reverse=True)
-
-    # Generate unique filename with UUID and datetime
-    now = datetime.now()
-    date_time_str = now.strftime("%Y%m%d_%H%M%S")
-    unique_id = str(uuid.uuid4())
-    filename = f"research_output_{date_time_str}_{unique_id}.md"
-    
-    # Prepare output content
-    output_content = []
-    output_content.append(f"# Research Results - {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
-    output_content.append(f"**Research Goal:** {args.goal}\n")
-    
-    output_content.append("## Research Overview\n")
-    output_content.append(final["overview"])
-    
-    output_content.append("\n## Shortlisted Hypotheses\n")
-    for h in sorted_population[: args.shortlist]:
-        output_content.append(f"- **{h.text}** (score={h.score:.1f}, gen={h.generation}, id={h.id[:8]})")
-    
+    sorted_population = shortlist(final, args.shortlist)
+
+    filename, now = output_filename()
+    report = render_markdown(args.goal, final, args.shortlist, now=now)
+
     # Write to markdown file
     try:
         with open(filename, 'w') as f:
-            f.write('\n'.join(output_content))
+            f.write(report)
         logger.info(f"Research output saved to {filename}")
     except Exception as e:
         logger.error(f"Failed to save research output to file: {str(e)}")
@@ -95,7 +88,7 @@ try:
     print("\n=== SHORTLIST ===\n")
     logger.info(f"Generating shortlist of top {args.shortlist} hypotheses")
 
-    for h in sorted_population[: args.shortlist]:
+    for h in sorted_population:
         print(f"- {h.text} (score={h.score:.1f}, gen={h.generation}, id={h.id[:8]})")
         logger.debug(
             f"Hypothesis: {h.id[:8]}, Score: {h.score:.1f}, Generation: {h.generation}"
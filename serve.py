@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import logging
+
+from coscientist.service import RunManager, make_server
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(threadName)s - %(message)s",
+    handlers=[logging.FileHandler("coscientist.log"), logging.StreamHandler()],
+    force=True,  # coscientist.agents configures the root logger on import
+)
+logger = logging.getLogger(__name__)
+
+parser = argparse.ArgumentParser(description="Long-running CoScientist service")
+parser.add_argument("--host", default="127.0.0.1")
+parser.add_argument("--port", type=int, default=8765)
+parser.add_argument("--socket", help="Serve on this Unix socket instead of TCP")
+parser.add_argument("--max-concurrent", type=int, default=4)
+parser.add_argument(
+    "--keep-finished", type=int, default=100, help="Finished runs kept in memory"
+)
+parser.add_argument(
+    "--finished-ttl",
+    type=float,
+    default=3600.0,
+    help="Seconds a finished run stays queryable",
+)
+parser.add_argument(
+    "--write-reports",
+    action="store_true",
+    help="Also write research_output_*.md for each completed run",
+)
+args = parser.parse_args()
+
+logger.info(f"Starting CoScientist service with arguments: {vars(args)}")
+
+manager = RunManager(
+    max_concurrent=args.max_concurrent,
+    write_reports=args.write_reports,
+    keep_finished=args.keep_finished,
+    finished_ttl=args.finished_ttl,
+)
+server = make_server(manager, host=args.host, port=args.port, socket_path=args.socket)
+logger.info(
+    f"Listening on {args.socket or f'http://{args.host}:{args.port}'}"
+)
+
+try:
+    server.serve_forever()
+except KeyboardInterrupt:
+    logger.info("Shutting down...")
+finally:
+    server.server_close()
+    manager.shutdown()
+    logger.info("Service stopped")